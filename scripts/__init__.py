@@ -2,6 +2,11 @@
 Media Workflow Toolbox Scripts
 
 This package contains the individual tools for the Media Workflow Toolbox.
+
+Each tool module exposes a main(args) entry function that runs its command
+line interface with the given argument list. The toolbox imports each tool
+module once and reuses it for every launch, so per-run setup belongs in the
+tool's entry function, not at module level.
 """
 
 __version__ = "0.1.0" 
\ No newline at end of file
@@ -6,19 +6,19 @@ This script organizes media files into categorized subfolders based on their ext
 It provides a rich console interface with progress bars and logging capabilities.
 """
 
+import errno
 import os
 import shutil
+import time
+from functools import cache
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Union
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskID
 from rich import print as rprint
 from loguru import logger
 import typer
 
-# Configure logger
-logger.add("file_sorter.log", rotation="1 MB")
-
 # Initialize Rich console
 console = Console()
 
@@ -32,22 +32,44 @@ EXTENSION_CATEGORIES: Dict[str, Set[str]] = {
     "EDITED": {".psd", ".xmp", ".ai"},
 }
 
+# Progress bar refresh: every N files or after this many seconds, whichever comes first
+PROGRESS_BATCH_SIZE = 64
+PROGRESS_INTERVAL = 0.05
+
+# Reverse lookup from extension to category
+EXT_TO_CATEGORY: Dict[str, str] = {
+    ext: category for category, extensions in EXTENSION_CATEGORIES.items() for ext in extensions
+}
+
 def create_category_folders(base_path: Path) -> Dict[str, Path]:
-    """Create category folders if they don't exist."""
+    """Create category folders, including MISC, if they don't exist."""
     category_paths = {}
-    for category in EXTENSION_CATEGORIES.keys():
+    for category in (*EXTENSION_CATEGORIES.keys(), "MISC"):
         category_path = base_path / category
         category_path.mkdir(exist_ok=True)
         category_paths[category] = category_path
     return category_paths
 
-def get_file_category(file_path: Path) -> str:
+def get_file_category(file_name: str) -> str:
     """Determine the category of a file based on its extension."""
-    ext = file_path.suffix.lower()
-    for category, extensions in EXTENSION_CATEGORIES.items():
-        if ext in extensions:
-            return category
-    return "MISC"
+    dot = file_name.rfind(".")
+    if dot <= 0:  # No extension, or a dotfile such as ".png"
+        return "MISC"
+    return EXT_TO_CATEGORY.get(file_name[dot:].lower(), "MISC")
+
+def move_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Move a file, using a single rename when source and destination share a filesystem.
+
+    Across filesystems the file is copied with shutil.copy2, which uses in-kernel
+    zero-copy where the platform supports it, and the source is then removed.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copy2(src, dst)
+        os.unlink(src)
 
 def sort_files(
     source_dir: str = typer.Argument(..., help="Source directory containing media files"),
@@ -73,7 +95,8 @@ def sort_files(
         category_paths = create_category_folders(source_path)
         
         # Get list of files to process
-        files_to_process = [f for f in source_path.iterdir() if f.is_file()]
+        with os.scandir(source_path) as entries:
+            files_to_process = [entry for entry in entries if entry.is_file()]
         
         if not files_to_process:
             console.print("[yellow]No files found to process[/yellow]")
@@ -87,26 +110,30 @@ def sort_files(
         ) as progress:
             
             task = progress.add_task("Sorting files...", total=len(files_to_process))
+            done = 0
+            last_update = time.monotonic()
             
-            for file_path in files_to_process:
-                category = get_file_category(file_path)
-                dest_dir = category_paths.get(category, source_path / "MISC")
-                dest_path = dest_dir / file_path.name
+            for entry in files_to_process:
+                category = get_file_category(entry.name)
+                dest_path = category_paths[category] / entry.name
 
                 if dry_run:
-                    console.print(f"Would move: {file_path.name} -> {dest_path}")
+                    console.print(f"Would move: {entry.name} -> {dest_path}")
                 else:
                     try:
-                        if not dest_dir.exists():
-                            dest_dir.mkdir(parents=True)
-                        if file_path != dest_path:
-                            shutil.move(str(file_path), str(dest_path))
-                            logger.info(f"Moved: {file_path.name} -> {dest_path}")
+                        move_file(entry.path, dest_path)
+                        logger.info(f"Moved: {entry.name} -> {dest_path}")
                     except Exception as e:
-                        logger.error(f"Error moving {file_path}: {str(e)}")
-                        console.print(f"[red]Error moving {file_path.name}: {str(e)}[/red]")
+                        logger.error(f"Error moving {entry.path}: {str(e)}")
+                        console.print(f"[red]Error moving {entry.name}: {str(e)}[/red]")
+
+                done += 1
+                now = time.monotonic()
+                if done % PROGRESS_BATCH_SIZE == 0 or now - last_update >= PROGRESS_INTERVAL:
+                    progress.update(task, completed=done)
+                    last_update = now
 
-                progress.update(task, advance=1)
+            progress.update(task, completed=done)
 
         console.print("[green]File sorting complete![/green]")
         logger.info("File sorting operation completed")
@@ -115,5 +142,18 @@ def sort_files(
         logger.error(f"An error occurred: {str(e)}")
         console.print(f"[red]An error occurred: {str(e)}[/red]")
 
+@cache
+def configure_logging() -> None:
+    """Add the log file sink. Runs once, on the first call from an entry point."""
+    logger.add("file_sorter.log", rotation="1 MB")
+
+app = typer.Typer()
+app.command()(sort_files)
+
+def main(args: Optional[List[str]] = None) -> None:
+    """Run the file sorter command line interface with the given arguments (default: sys.argv)."""
+    configure_logging()
+    app(args=args, prog_name="file_sorter.py")
+
 if __name__ == "__main__":
-    typer.run(sort_files) 
\ No newline at end of file
+    main() 
\ No newline at end of file
@@ -8,71 +8,286 @@ Useful for checking if all files were properly copied or processed.
 
 import os
 import shutil
+import sqlite3
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Set, Dict, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import cache, partial
 from rich.console import Console
 from rich.table import Table
 from rich import print as rprint
 from rich.prompt import Prompt, Confirm
 from loguru import logger
+from blake3 import blake3
 import typer
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 from enum import Enum
 
-# Configure logger
-logger.add("folder_compare.log", rotation="1 MB")
-
 # Initialize Rich console
 console = Console()
 
+# Default number of worker threads used to scan and hash files. Threads rather
+# than processes: file reads and BLAKE3 updates both release the GIL, and only
+# two chunks per file are hashed, so the work stays I/O-bound.
+DEFAULT_JOBS = 16
+
+# Number of files handled between progress bar refreshes
+PROGRESS_BATCH_SIZE = 64
+
+# Files queued for stat/hashing per worker thread; bounds memory on large trees
+FILES_IN_FLIGHT_PER_JOB = 4
+
+# Persistent cache of quick hashes, reused across runs
+HASH_CACHE_FILE = Path.home() / ".cache" / "folder_compare" / "hashes.sqlite"
+
+# Per-thread buffers reused by calculate_file_hash
+_read_buffers = threading.local()
+
 class Action(str, Enum):
     NONE = "none"
     MOVE = "move"
     DELETE = "delete"
 
-def calculate_file_hash(file_path: Path, chunk_size: int = 8192) -> str:
-    """Calculate a quick hash of the first and last chunks of a file."""
-    import hashlib
-    
-    if not file_path.is_file():
-        return ""
+def _read_buffer(size: int) -> bytearray:
+    """Return this thread's reusable read buffer, resized to the requested size."""
+    buffer = getattr(_read_buffers, "buffer", None)
+    if buffer is None or len(buffer) != size:
+        buffer = _read_buffers.buffer = bytearray(size)
+    return buffer
+
+def calculate_file_hash(file_path: Path, chunk_size: int = 131072, file_size: Optional[int] = None) -> str:
+    """Calculate a quick BLAKE3 hash of the first and last chunks of a file.
+
+    Callers that already know the file size (e.g. from a directory scan) can
+    pass it as file_size to skip the extra stat calls.
+    """
+    if file_size is None:
+        if not file_path.is_file():
+            return ""
+        file_size = file_path.stat().st_size
     
-    md5 = hashlib.md5()
-    file_size = file_path.stat().st_size
+    hasher = blake3()
+    buffer = _read_buffer(chunk_size)
+    view = memoryview(buffer)
     
     with open(file_path, 'rb') as f:
         # Read first chunk
-        data = f.read(chunk_size)
-        md5.update(data)
+        read = f.readinto(buffer)
+        hasher.update(view[:read])
         
         # If file is larger than chunk_size, read last chunk
         if file_size > chunk_size:
             f.seek(-chunk_size, 2)
-            data = f.read(chunk_size)
-            md5.update(data)
+            read = f.readinto(buffer)
+            hasher.update(view[:read])
     
-    return md5.hexdigest()
+    return hasher.hexdigest()
 
-def get_files_info(directory: Path) -> Dict[str, Tuple[int, str]]:
-    """Get information about files in a directory."""
-    files_info = {}
+def _scan_dir(directory: str, prefix: str) -> Tuple[List[Tuple[str, os.DirEntry]], List[Tuple[str, str]]]:
+    """List the files (following symlinks) and real subdirectories of a single directory."""
+    files, subdirs = [], []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, f"{prefix}{entry.name}{os.sep}"))
+                elif entry.is_file():
+                    files.append((f"{prefix}{entry.name}", entry))
+    except OSError as e:
+        # Skip unreadable directories (e.g. "System Volume Information") like rglob does
+        logger.warning(f"Skipping unreadable directory {directory}: {str(e)}")
+        return [], []
+    return files, subdirs
+
+def _scan_files(executor: ThreadPoolExecutor, directory: str) -> Iterator[Tuple[str, os.DirEntry]]:
+    """Walk a directory tree, scanning subdirectories concurrently and yielding files as each directory is read."""
+    pending = {executor.submit(_scan_dir, directory, "")}
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            found, subdirs = future.result()
+            pending.update(executor.submit(_scan_dir, path, prefix) for path, prefix in subdirs)
+            yield from found
+
+class _HashCache:
+    """Persistent SQLite cache of quick hashes keyed by absolute path, size and mtime.
+
+    Writes are autocommitted so concurrent runs never wait on a long transaction.
+    Any database error disables the cache for the rest of the run; lookups then miss.
+    """
+
+    def __init__(self, db_path: Path = HASH_CACHE_FILE):
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._enabled = True
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes "
+            "(abs_path TEXT PRIMARY KEY, size INT, mtime REAL, hash TEXT)"
+        )
+
+    @classmethod
+    def open(cls) -> Optional["_HashCache"]:
+        """Open the default cache, or return None if it cannot be used."""
+        try:
+            return cls()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Hash cache unavailable, hashing all files: {str(e)}")
+            return None
+
+    def _disable(self, e: sqlite3.Error) -> None:
+        """Stop using the cache after a database error. Must be called with the lock held."""
+        if self._enabled:
+            self._enabled = False
+            logger.warning(f"Hash cache disabled, hashing all files: {str(e)}")
+
+    def get(self, abs_path: str, size: int, mtime: float) -> Optional[str]:
+        """Return the cached hash if the file is unchanged since it was stored."""
+        with self._lock:
+            if not self._enabled:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT hash FROM hashes WHERE abs_path = ? AND size = ? AND mtime = ?",
+                    (abs_path, size, mtime),
+                ).fetchone()
+            except sqlite3.Error as e:
+                self._disable(e)
+                return None
+        return row[0] if row else None
+
+    def put(self, abs_path: str, size: int, mtime: float, quick_hash: str) -> None:
+        """Store the hash for a file, replacing any previous entry."""
+        with self._lock:
+            if not self._enabled:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO hashes (abs_path, size, mtime, hash) VALUES (?, ?, ?, ?)",
+                    (abs_path, size, mtime, quick_hash),
+                )
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Error closing hash cache: {str(e)}")
+
+def _cached_hash(file_path: str, size: int, mtime: float, cache: Optional[_HashCache] = None) -> str:
+    """Get the quick hash of a file, reusing the cached value if the file is unchanged."""
+    abs_path = os.path.abspath(file_path)
+    quick_hash = cache.get(abs_path, size, mtime) if cache else None
+    if quick_hash is None:
+        quick_hash = calculate_file_hash(Path(file_path), file_size=size)
+        if cache:
+            cache.put(abs_path, size, mtime, quick_hash)
+    return quick_hash
+
+def _file_info(
+    item: Tuple[str, os.DirEntry],
+    compute_hash: bool = True,
+    cache: Optional[_HashCache] = None,
+) -> Tuple[str, Tuple[int, str]]:
+    """Get the size and, if requested, the quick hash of a scanned file."""
+    rel_path, entry = item
+    stat = entry.stat()
+    quick_hash = _cached_hash(entry.path, stat.st_size, stat.st_mtime, cache) if compute_hash else ""
+    return rel_path, (stat.st_size, quick_hash)
+
+def _hashes_match(rel_path: str, source_dir: str, target_dir: str, cache: Optional[_HashCache] = None) -> bool:
+    """Check whether a file has the same quick hash in both directories."""
+    hashes = []
+    for directory in (source_dir, target_dir):
+        file_path = os.path.join(directory, rel_path)
+        stat = os.stat(file_path)
+        hashes.append(_cached_hash(file_path, stat.st_size, stat.st_mtime, cache))
+    return hashes[0] == hashes[1]
+
+def iter_files_info(
+    directory: Path,
+    jobs: int = DEFAULT_JOBS,
+    compute_hash: bool = True,
+    use_cache: bool = True,
+) -> Iterator[Tuple[str, Tuple[int, str]]]:
+    """Yield (relative path, (size, hash)) for every file in a directory as it is processed.
+
+    When compute_hash is False the hash is left empty and file contents are never read.
+    When use_cache is True, hashes of unchanged files are read from the persistent hash cache.
+    """
+    cache = _HashCache.open() if compute_hash and use_cache else None
     
-    for file_path in directory.rglob("*"):
-        if file_path.is_file():
-            rel_path = str(file_path.relative_to(directory))
-            size = file_path.stat().st_size
-            quick_hash = calculate_file_hash(file_path)
-            files_info[rel_path] = (size, quick_hash)
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            file_info = partial(_file_info, compute_hash=compute_hash, cache=cache)
+            max_in_flight = jobs * FILES_IN_FLIGHT_PER_JOB
+            in_flight = deque()
+            for item in _scan_files(executor, str(directory)):
+                in_flight.append(executor.submit(file_info, item))
+                if len(in_flight) >= max_in_flight:
+                    yield in_flight.popleft().result()
+            while in_flight:
+                yield in_flight.popleft().result()
+    finally:
+        if cache:
+            cache.close()
+
+def get_files_info(
+    directory: Path,
+    jobs: int = DEFAULT_JOBS,
+    compute_hash: bool = True,
+    use_cache: bool = True,
+) -> Dict[str, Tuple[int, str]]:
+    """Get information about files in a directory."""
+    return dict(iter_files_info(directory, jobs, compute_hash, use_cache))
+
+def find_content_mismatches(
+    source_dir: Path,
+    target_dir: Path,
+    filenames: List[str],
+    jobs: int = DEFAULT_JOBS,
+    use_cache: bool = True,
+) -> List[str]:
+    """Return the files whose quick hashes differ between the two directories.
+
+    Only files already known to have the same size on both sides need to be checked.
+    """
+    cache = _HashCache.open() if use_cache else None
     
-    return files_info
+    try:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            matches = executor.map(
+                partial(_hashes_match, source_dir=str(source_dir), target_dir=str(target_dir), cache=cache),
+                filenames,
+            )
+            return [filename for filename, match in zip(filenames, matches) if not match]
+    finally:
+        if cache:
+            cache.close()
+
+def _delete_file(item: Tuple[Path, str]) -> None:
+    """Delete an unpaired file if it still exists."""
+    file_path, kind = item
+    try:
+        os.unlink(file_path)
+    except FileNotFoundError:
+        return
+    logger.info(f"Deleted {kind} file: {file_path}")
 
 def handle_unpaired_files(
     source_path: Path,
     target_path: Path,
-    missing_files: Set[str],
-    extra_files: Set[str],
+    missing_files: List[str],
+    extra_files: List[str],
     action: Action,
-    destination_folder: str = None
+    destination_folder: str = None,
+    jobs: int = DEFAULT_JOBS,
 ) -> None:
     """Handle unpaired files based on the selected action."""
     if action == Action.NONE:
@@ -118,24 +333,18 @@ def handle_unpaired_files(
             if not Confirm.ask("[red]Are you sure you want to delete unpaired files?[/red] This cannot be undone"):
                 return
 
+            # Missing files are deleted from source, extra files from target
+            to_delete = [(source_path / file_path, "missing") for file_path in missing_files]
+            to_delete += [(target_path / file_path, "extra") for file_path in extra_files]
+
             with Progress() as progress:
-                task = progress.add_task("Deleting unpaired files...", total=len(missing_files) + len(extra_files))
+                task = progress.add_task("Deleting unpaired files...", total=len(to_delete))
                 
-                # Delete missing files from source
-                for file_path in missing_files:
-                    src = source_path / file_path
-                    if src.exists():
-                        src.unlink()
-                        logger.info(f"Deleted missing file: {src}")
-                    progress.update(task, advance=1)
-
-                # Delete extra files from target
-                for file_path in extra_files:
-                    src = target_path / file_path
-                    if src.exists():
-                        src.unlink()
-                        logger.info(f"Deleted extra file: {src}")
-                    progress.update(task, advance=1)
+                with ThreadPoolExecutor(max_workers=jobs) as executor:
+                    for done, _ in enumerate(executor.map(_delete_file, to_delete), 1):
+                        if done % PROGRESS_BATCH_SIZE == 0:
+                            progress.update(task, completed=done)
+                progress.update(task, completed=len(to_delete))
 
             console.print("[green]Unpaired files deleted successfully[/green]")
 
@@ -149,6 +358,8 @@ def compare_folders(
     check_content: bool = typer.Option(False, "--check-content", "-c", help="Compare file contents, not just names"),
     action: Action = typer.Option(Action.NONE, "--action", "-a", help="Action to take with unpaired files"),
     destination_folder: str = typer.Option(None, "--dest", "-d", help="Destination folder name for unpaired files (required for move action)"),
+    jobs: int = typer.Option(DEFAULT_JOBS, "--jobs", "-j", min=1, help="Number of worker threads used to scan and hash files"),
+    use_cache: bool = typer.Option(True, "--cache/--no-cache", help="Reuse hashes of unchanged files from previous runs"),
 ) -> None:
     """
     Compare two folders and show differences in files.
@@ -159,6 +370,8 @@ def compare_folders(
         check_content: If True, compare file contents (size and hash) not just names
         action: Action to take with unpaired files (none, move, or delete)
         destination_folder: Destination folder name for unpaired files when using move action
+        jobs: Number of worker threads used to scan and hash files
+        use_cache: If True, reuse cached hashes of files unchanged since a previous run
     """
     try:
         source_path = Path(source_dir).resolve()
@@ -184,28 +397,36 @@ def compare_folders(
         ) as progress:
             
             task1 = progress.add_task("Scanning source directory...", total=None)
-            source_files = get_files_info(source_path)
+            source_files = get_files_info(source_path, jobs, compute_hash=False)
             progress.update(task1, completed=True)
             
+            # Classify target files as they are scanned; source entries left over are missing.
+            # A size difference already proves a content mismatch, so only files with
+            # equal sizes are hashed afterwards.
             task2 = progress.add_task("Scanning target directory...", total=None)
-            target_files = get_files_info(target_path)
+            extra_files = []
+            content_mismatches = []
+            same_size_files = []
+            for filename, (target_size, _) in iter_files_info(target_path, jobs, compute_hash=False):
+                source_info = source_files.pop(filename, None)
+                if source_info is None:
+                    extra_files.append(filename)
+                elif check_content:
+                    if source_info[0] != target_size:
+                        content_mismatches.append(filename)
+                    else:
+                        same_size_files.append(filename)
+            missing_files = sorted(source_files)
+            extra_files.sort()
             progress.update(task2, completed=True)
 
-        # Create sets of filenames
-        source_filenames = set(source_files.keys())
-        target_filenames = set(target_files.keys())
-
-        # Find missing and extra files
-        missing_files = source_filenames - target_filenames
-        extra_files = target_filenames - source_filenames
-        common_files = source_filenames & target_filenames
-
-        # Check for content mismatches if requested
-        content_mismatches = set()
-        if check_content:
-            for filename in common_files:
-                if source_files[filename] != target_files[filename]:
-                    content_mismatches.add(filename)
+            if same_size_files:
+                task3 = progress.add_task("Comparing file contents...", total=None)
+                content_mismatches.extend(
+                    find_content_mismatches(source_path, target_path, same_size_files, jobs, use_cache)
+                )
+                progress.update(task3, completed=True)
+            content_mismatches.sort()
 
         # Create and display results table
         table = Table(title="Folder Comparison Results")
@@ -216,21 +437,21 @@ def compare_folders(
         if missing_files:
             table.add_row(
                 "Missing in Target",
-                "\n".join(sorted(missing_files)),
+                "\n".join(missing_files),
                 str(len(missing_files))
             )
 
         if extra_files:
             table.add_row(
                 "Extra in Target",
-                "\n".join(sorted(extra_files)),
+                "\n".join(extra_files),
                 str(len(extra_files))
             )
 
         if check_content and content_mismatches:
             table.add_row(
                 "Content Mismatches",
-                "\n".join(sorted(content_mismatches)),
+                "\n".join(content_mismatches),
                 str(len(content_mismatches))
             )
 
@@ -252,12 +473,26 @@ def compare_folders(
                 missing_files,
                 extra_files,
                 action,
-                destination_folder
+                destination_folder,
+                jobs
             )
 
     except Exception as e:
         logger.error(f"An error occurred: {str(e)}")
         console.print(f"[red]An error occurred: {str(e)}[/red]")
 
+@cache
+def configure_logging() -> None:
+    """Add the log file sink. Runs once, on the first call from an entry point."""
+    logger.add("folder_compare.log", rotation="1 MB")
+
+app = typer.Typer()
+app.command()(compare_folders)
+
+def main(args: Optional[List[str]] = None) -> None:
+    """Run the folder comparison command line interface with the given arguments (default: sys.argv)."""
+    configure_logging()
+    app(args=args, prog_name="folder_compare.py")
+
 if __name__ == "__main__":
-    typer.run(compare_folders) 
\ No newline at end of file
+    main() 
\ No newline at end of file
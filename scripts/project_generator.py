@@ -8,8 +8,9 @@ Supports custom templates and project initialization.
 
 import os
 import json
+from functools import cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich import print as rprint
@@ -17,9 +18,6 @@ from loguru import logger
 import typer
 from datetime import datetime
 
-# Configure logger
-logger.add("project_generator.log", rotation="1 MB")
-
 # Initialize Rich console
 console = Console()
 
@@ -66,16 +64,30 @@ DEFAULT_TEMPLATES = {
     }
 }
 
+# Parsed templates files: path -> ((mtime_ns, size), templates)
+_TEMPLATES_CACHE: Dict[str, Tuple[Tuple[int, int], Dict]] = {}
+
 def load_templates(templates_file: Path) -> Dict:
-    """Load custom templates from a JSON file or return defaults."""
-    if templates_file.exists():
+    """Load custom templates from a JSON file or return defaults.
+
+    Parsed files are cached and reused until the file's mtime or size changes.
+    """
+    try:
+        stat = templates_file.stat()
+    except OSError:
+        return dict(DEFAULT_TEMPLATES)
+
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _TEMPLATES_CACHE.get(str(templates_file))
+    if cached is None or cached[0] != version:
         try:
             with open(templates_file) as f:
                 custom_templates = json.load(f)
-                return {**DEFAULT_TEMPLATES, **custom_templates}
         except json.JSONDecodeError:
             logger.warning(f"Error reading {templates_file}. Using default templates.")
-    return DEFAULT_TEMPLATES
+            return dict(DEFAULT_TEMPLATES)
+        cached = _TEMPLATES_CACHE[str(templates_file)] = (version, {**DEFAULT_TEMPLATES, **custom_templates})
+    return dict(cached[1])
 
 def save_template(templates_file: Path, template_name: str, structure: Dict) -> None:
     """Save a new template to the templates file."""
@@ -89,13 +101,31 @@ def save_template(templates_file: Path, template_name: str, structure: Dict) ->
         json.dump(templates, f, indent=4)
     logger.info(f"Saved new template: {template_name}")
 
-def create_structure(base_path: Path, structure: Dict, prefix: str = "") -> None:
-    """Recursively create folder structure."""
-    for name, substructure in structure.items():
-        folder_path = base_path / f"{prefix}{name}"
-        folder_path.mkdir(exist_ok=True)
+def create_structure(base_path: Path, structure: Dict, prefix: str = "") -> List[str]:
+    """Create folder structure, making each leaf folder together with its parents.
+
+    Returns the paths of all folders in the structure, parents before children.
+    """
+    folders = []
+    leaves = []
+    stack = [
+        (os.path.join(str(base_path), f"{prefix}{name}"), substructure)
+        for name, substructure in reversed(structure.items())
+    ]
+    while stack:
+        folder_path, substructure = stack.pop()
+        folders.append(folder_path)
         if substructure:  # If there are subfolders
-            create_structure(folder_path, substructure)
+            stack.extend(
+                (os.path.join(folder_path, name), children)
+                for name, children in reversed(substructure.items())
+            )
+        else:
+            leaves.append(folder_path)
+
+    for folder_path in leaves:
+        os.makedirs(folder_path, exist_ok=True)
+    return folders
 
 def generate_project(
     project_name: str = typer.Argument(..., help="Name of the project"),
@@ -126,8 +156,9 @@ def generate_project(
             return
 
         # Create project folder name
+        now = datetime.now()
         if date_prefix:
-            date_str = datetime.now().strftime("%Y%m%d")
+            date_str = now.strftime("%Y%m%d")
             project_folder = f"{date_str}_{project_name}"
         else:
             project_folder = project_name
@@ -142,12 +173,12 @@ def generate_project(
         # Create project structure
         console.print(f"[blue]Creating project structure for: {project_folder}[/blue]")
         project_path.mkdir(exist_ok=True)
-        create_structure(project_path, templates[template]["structure"])
+        folders = create_structure(project_path, templates[template]["structure"])
 
         # Create a project info file
         info = {
             "project_name": project_name,
-            "created_date": datetime.now().isoformat(),
+            "created_date": now.isoformat(),
             "template_used": template
         }
         
@@ -159,10 +190,9 @@ def generate_project(
 
         # Show tree structure
         console.print("\n[yellow]Project Structure:[/yellow]")
-        for item in project_path.rglob("*"):
-            if item.is_dir():
-                depth = len(item.relative_to(project_path).parts)
-                console.print("  " * depth + f"📁 {item.name}")
+        for folder_path in folders:
+            depth = os.path.relpath(folder_path, project_path).count(os.sep) + 1
+            console.print("  " * depth + f"📁 {os.path.basename(folder_path)}")
 
     except Exception as e:
         logger.error(f"An error occurred: {str(e)}")
@@ -190,9 +220,19 @@ def add_template(
         logger.error(f"An error occurred: {str(e)}")
         console.print(f"[red]An error occurred: {str(e)}[/red]")
 
+@cache
+def configure_logging() -> None:
+    """Add the log file sink. Runs once, on the first call from an entry point."""
+    logger.add("project_generator.log", rotation="1 MB")
+
 app = typer.Typer()
 app.command()(generate_project)
 app.command()(add_template)
 
+def main(args: Optional[List[str]] = None) -> None:
+    """Run the project generator command line interface with the given arguments (default: sys.argv)."""
+    configure_logging()
+    app(args=args, prog_name="project_generator.py")
+
 if __name__ == "__main__":
-    app() 
\ No newline at end of file
+    main() 
\ No newline at end of file
@@ -6,31 +6,45 @@ A collection of tools for photographers and videographers to streamline their wo
 """
 
 import os
+import shlex
 import sys
-from typing import List, Callable
+import threading
+from dataclasses import dataclass, field
+from typing import List
 from rich.console import Console
+from rich.markup import escape
 from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.table import Table
 from textual.app import App, ComposeResult
 from textual.containers import Container
 from textual.widgets import Header, Footer, Button, Static
 from textual.screen import Screen
-import importlib.util
+import importlib
 from pathlib import Path
 
 # Initialize Rich console
 console = Console()
 
+# Welcome message shown before the TUI starts
+_WELCOME_PANEL = Panel.fit(
+    "[bold blue]Media Workflow Toolbox[/bold blue]\n"
+    "A collection of tools for photographers and videographers",
+    border_style="green"
+)
+
+@dataclass(frozen=True, slots=True)
 class ToolDescription:
-    def __init__(self, name: str, module: str, description: str, function: str = "main"):
-        self.name = name
-        self.module = module
-        self.description = description
-        self.function = function
+    name: str
+    module: str
+    description: str
+    function: str = "main"
+    button_id: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Textual ids may only contain letters, numbers, underscores and hyphens
+        object.__setattr__(self, "button_id", f"tool_{self.module.replace('.', '_')}")
 
 # Available tools
-TOOLS = [
+TOOLS = (
     ToolDescription(
         "File Sorter",
         "scripts.file_sorter",
@@ -46,105 +60,110 @@ TOOLS = [
         "scripts.project_generator",
         "Create standardized folder structures for photo and video projects",
     ),
-]
+)
 
-class ToolButton(Button):
-    def __init__(self, tool: ToolDescription):
-        super().__init__(tool.name, id=f"tool_{tool.module}")
-        self.tool = tool
+# Tool lookup by button id, used to dispatch button presses
+_TOOL_BY_ID = {tool.button_id: tool for tool in TOOLS}
+
+def _split_args(line: str) -> List[str]:
+    """Split an argument line like a shell would, keeping backslashes in Windows paths."""
+    if os.name != "nt":
+        return shlex.split(line)
+    # Non-POSIX mode keeps backslashes but also keeps the quotes around quoted arguments
+    return [
+        arg[1:-1] if len(arg) >= 2 and arg[0] == arg[-1] and arg[0] in "\"'" else arg
+        for arg in shlex.split(line, posix=False)
+    ]
 
 class ToolboxScreen(Screen):
     BINDINGS = [("q", "quit", "Quit")]
 
+    def __init__(self) -> None:
+        super().__init__()
+        # Build the tool buttons once per screen
+        self._tool_buttons = tuple(Button(tool.name, id=tool.button_id) for tool in TOOLS)
+
     def compose(self) -> ComposeResult:
         yield Header(show_clock=True)
         yield Container(
             Static("Select a tool to run:", classes="title"),
-            *[ToolButton(tool) for tool in TOOLS],
+            *self._tool_buttons,
             id="tool-list"
         )
         yield Footer()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        button = event.button
-        if isinstance(button, ToolButton):
-            self.run_tool(button.tool)
+        tool = _TOOL_BY_ID.get(event.button.id)
+        if tool is not None:
+            self.run_tool(tool)
 
     def run_tool(self, tool: ToolDescription) -> None:
         try:
-            # Import the module
-            module_spec = importlib.util.find_spec(tool.module)
-            if module_spec is None:
-                console.print(f"[red]Error: Module {tool.module} not found[/red]")
+            # Import the module (import_module returns it from sys.modules if already loaded)
+            try:
+                module = importlib.import_module(tool.module)
+            except ImportError as e:
+                if e.name != tool.module:
+                    # The tool exists but one of its own imports failed; report the real error
+                    raise
+                self.notify(escape(f"Module {tool.module} not found"), severity="error")
                 return
 
-            module = importlib.util.module_from_spec(module_spec)
-            module_spec.loader.exec_module(module)
-
             # Get the main function
             main_func = getattr(module, tool.function, None)
             if main_func is None:
-                console.print(f"[red]Error: Function {tool.function} not found in {tool.module}[/red]")
+                self.notify(escape(f"Function {tool.function} not found in {tool.module}"), severity="error")
                 return
 
-            # Exit the TUI temporarily
-            self.app.exit()
-
-            # Run the tool
-            console.print(f"\n[blue]Running {tool.name}...[/blue]\n")
-            main_func()
-
-            # Prompt to return to menu
-            input("\nPress Enter to return to the menu...")
-
-            # Restart the TUI
-            self.app.run()
+            # Suspend the TUI and hand the terminal to the tool
+            with self.app.suspend():
+                console.print(f"\n[blue]Running {tool.name}...[/blue]\n")
+                prompt = "\nPress Enter to return to the menu..."
+                try:
+                    args = console.input(f"Arguments for {tool.name} (--help for usage): ")
+                    main_func(_split_args(args))
+                except SystemExit:
+                    # Typer exits once the command finishes, even on success
+                    pass
+                except Exception as e:
+                    # Emit the error together with the prompt in a single write
+                    prompt = f"[red]Error running {tool.name}: {str(e)}[/red]\n{prompt}"
+
+                # Prompt to return to menu
+                console.input(prompt)
 
         except Exception as e:
-            console.print(f"[red]Error running {tool.name}: {str(e)}[/red]")
-            input("\nPress Enter to return to the menu...")
-            self.app.run()
+            # The TUI is active here, so report through a notification rather than the console.
+            # Notifications render markup, so the message is escaped.
+            self.notify(escape(f"Error running {tool.name}: {str(e)}"), severity="error")
 
 class ToolboxApp(App):
-    CSS = """
-    Screen {
-        align: center middle;
-    }
-
-    #tool-list {
-        width: 60;
-        height: auto;
-        border: solid green;
-        padding: 1 2;
-    }
-
-    Button {
-        width: 100%;
-        margin: 1 0;
-    }
-
-    .title {
-        text-align: center;
-        padding: 1;
-    }
-    """
+    CSS_PATH = "toolbox.tcss"
 
     def on_mount(self) -> None:
         self.push_screen(ToolboxScreen())
+        # Import tool modules while the user is choosing a tool
+        threading.Thread(target=self._preload_tools, daemon=True).start()
+
+    def _preload_tools(self) -> None:
+        """Import every tool module ahead of time so launching a tool doesn't wait on imports."""
+        for tool in TOOLS:
+            try:
+                importlib.import_module(tool.module)
+            except Exception as e:
+                # Broken tools are reported to the user when they are launched
+                self.log.debug(f"Could not preload {tool.module}: {str(e)}")
 
 def main():
     """Run the Media Workflow Toolbox."""
     try:
         # Ensure scripts directory is in Python path
-        scripts_dir = Path(__file__).parent
-        sys.path.append(str(scripts_dir))
+        scripts_dir = str(Path(__file__).parent)
+        if scripts_dir not in sys.path:
+            sys.path.insert(0, scripts_dir)
 
         # Show welcome message
-        console.print(Panel.fit(
-            "[bold blue]Media Workflow Toolbox[/bold blue]\n"
-            "A collection of tools for photographers and videographers",
-            border_style="green"
-        ))
+        console.print(_WELCOME_PANEL)
 
         # Start the TUI
         app = ToolboxApp()